@@ -0,0 +1,229 @@
+"""Scraper parser benchmarks.
+
+fixtures: run every parser against the recorded pages and Serper responses in
+fixtures/ (no browser, no network) and report cards parsed per second,
+field-level accuracy against the expected records, and regressions against
+fixtures/baseline.json. Exits non-zero when a previously matching field breaks.
+
+    python bench_scrapers.py fixtures [--repeat 20] [--save-baseline]
+
+browser: load a saved LinkedIn people results page into headless Chrome and
+compare per-element extraction with the page_source path on the same DOM.
+
+    python bench_scrapers.py browser saved_people_results.html --repeat 5
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from app import LinkedInScraper, TwelveTwentyScraper, parse_serper_jobs, parse_serper_organic, chromedriver_path
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+BASELINE_PATH = os.path.join(FIXTURES_DIR, 'baseline.json')
+
+
+def offline_scraper(cls):
+    # The parsers only read class-level selectors; skip __init__'s user lookup
+    scraper = cls.__new__(cls)
+    scraper.user = None
+    scraper.driver = None
+    return scraper
+
+
+def parse_linkedin_jobs(raw, entry):
+    scraper = offline_scraper(LinkedInScraper)
+    jobs = [scraper._parse_job_card_fields(fields) for fields in scraper._extract_job_cards_from_html(raw)]
+    return [job for job in jobs if job and job['role'] and len(job['role']) > 3]
+
+
+def parse_linkedin_people(raw, entry):
+    scraper = offline_scraper(LinkedInScraper)
+    return [fields for fields in scraper._extract_people_from_html(raw) if fields.get('name')]
+
+
+def parse_twelve_twenty_jobs(raw, entry):
+    scraper = offline_scraper(TwelveTwentyScraper)
+    jobs = [scraper._job_from_listing_fields(fields, i) for i, fields in enumerate(scraper._extract_listings_from_html(raw))]
+    return [job for job in jobs if job]
+
+
+PARSERS = {
+    'linkedin_jobs': parse_linkedin_jobs,
+    'linkedin_people': parse_linkedin_people,
+    'twelve_twenty_jobs': parse_twelve_twenty_jobs,
+    'serper_jobs': lambda raw, entry: parse_serper_jobs(json.loads(raw), entry.get('location', '')),
+    'serper_organic': lambda raw, entry: parse_serper_organic(json.loads(raw), entry.get('location', ''))
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def timed(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def score(expected, actual):
+    """Compare records by position; returns (matched field ids, misses)"""
+    matched = []
+    misses = []
+    for i, expected_record in enumerate(expected):
+        actual_record = actual[i] if i < len(actual) else {}
+        for key, value in expected_record.items():
+            field_id = f'{i}.{key}'
+            if actual_record.get(key) == value:
+                matched.append(field_id)
+            else:
+                misses.append((field_id, value, actual_record.get(key)))
+    return matched, misses
+
+
+def run_fixtures(args):
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    total_matched = total_fields = 0
+
+    print(f"{'fixture':<24}{'cards':>7}{'cards/s':>12}{'vs base':>9}{'accuracy':>10}")
+    for entry in manifest:
+        raw = load_fixture(entry['input'])
+        expected = json.loads(load_fixture(entry['expected']))
+        parser = PARSERS[entry['parser']]
+
+        records, elapsed = timed(lambda: parser(raw, entry), args.repeat)
+        rate = len(records) / elapsed if elapsed else 0
+        matched, misses = score(expected, records)
+        fields = len(matched) + len(misses)
+        total_matched += len(matched)
+        total_fields += fields
+
+        previous = baseline.get(entry['name'], {})
+        speed = f"{rate / previous['cards_per_second']:.2f}x" if previous.get('cards_per_second') else '-'
+        accuracy = len(matched) / fields if fields else 1.0
+        print(f"{entry['name']:<24}{len(records):>7}{rate:>12.0f}{speed:>9}{accuracy:>10.1%}")
+
+        if args.verbose:
+            for field_id, want, got in misses:
+                print(f"    miss {field_id}: expected {want!r}, got {got!r}")
+
+        lost = sorted(set(previous.get('matched', [])) - set(matched))
+        for field_id in lost:
+            want, got = next((want, got) for miss_id, want, got in misses if miss_id == field_id)
+            regressions.append(f"{entry['name']} {field_id}: expected {want!r}, got {got!r}")
+        if args.max_slowdown and previous.get('cards_per_second') and rate < previous['cards_per_second'] * (1 - args.max_slowdown):
+            regressions.append(f"{entry['name']}: {rate:.0f} cards/s vs baseline {previous['cards_per_second']:.0f}")
+
+        results[entry['name']] = {'cards_per_second': round(rate, 1), 'accuracy': round(accuracy, 4), 'matched': matched}
+
+    overall = total_matched / total_fields if total_fields else 1.0
+    print(f"overall field accuracy: {overall:.1%} ({total_matched}/{total_fields})")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"baseline written to {BASELINE_PATH}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+def run_browser(args):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+
+    def per_element_people(scraper, driver):
+        cards = []
+        for selector in scraper.PEOPLE_CARD_SELECTORS:
+            cards = driver.find_elements(By.CSS_SELECTOR, selector)
+            if cards:
+                break
+        return [scraper._person_fields_from_element(card) for card in cards[:args.limit]]
+
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+
+    try:
+        driver.get('file://' + os.path.abspath(args.html))
+        scraper = offline_scraper(LinkedInScraper)
+        scraper.driver = driver
+
+        element_fields, element_time = timed(lambda: per_element_people(scraper, driver), args.repeat)
+        bulk_fields, bulk_time = timed(lambda: scraper._extract_people_from_html(driver.page_source, limit=args.limit), args.repeat)
+
+        element_fields = [fields for fields in element_fields if fields]
+        bulk_fields = [fields for fields in bulk_fields if fields.get('name')]
+
+        print(f"{'path':<14}{'cards':>8}{'best ms':>12}{'cards/s':>12}")
+        for label, found, elapsed in (('per-element', len(element_fields), element_time),
+                                      ('page source', len(bulk_fields), bulk_time)):
+            rate = found / elapsed if elapsed else 0
+            print(f"{label:<14}{found:>8}{elapsed * 1000:>12.1f}{rate:>12.1f}")
+
+        if element_time and bulk_time:
+            print(f"speedup: {element_time / bulk_time:.1f}x")
+
+        mismatches = 0
+        for element, bulk in zip(element_fields, bulk_fields):
+            for key in ('name', 'profile_url', 'subtitle', 'location', 'summaries'):
+                if element.get(key) != bulk.get(key):
+                    mismatches += 1
+                    print(f"  ≠ {key}: {element.get(key)!r} vs {bulk.get(key)!r}")
+        if len(element_fields) != len(bulk_fields):
+            print(f"  ≠ card count: {len(element_fields)} vs {len(bulk_fields)}")
+        print(f"field mismatches: {mismatches}")
+    finally:
+        driver.quit()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    fixtures = commands.add_parser('fixtures', help='benchmark parsers against the recorded fixture corpus')
+    fixtures.add_argument('--repeat', type=int, default=20)
+    fixtures.add_argument('--save-baseline', action='store_true', help='record these results as the new baseline')
+    fixtures.add_argument('--max-slowdown', type=float, default=None,
+                          help='also fail when cards/s drops by more than this fraction of the baseline')
+    fixtures.add_argument('-v', '--verbose', action='store_true', help='list every missed field')
+
+    browser = commands.add_parser('browser', help='compare per-element and page_source people extraction')
+    browser.add_argument('html', help='saved LinkedIn people search results page')
+    browser.add_argument('--repeat', type=int, default=5)
+    browser.add_argument('--limit', type=int, default=10)
+
+    args = parser.parse_args()
+    return run_fixtures(args) if args.command == 'fixtures' else run_browser(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
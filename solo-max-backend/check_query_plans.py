@@ -0,0 +1,216 @@
+"""Query plan audit for the hot model lookups.
+
+Seeds a throwaway SQLite database with a large dataset, drives the read routes
+(plus the scraper and scheduler lookups that can run offline), records every
+SELECT/UPDATE/DELETE they issue and runs EXPLAIN QUERY PLAN on each one. Exits
+non-zero when a query reads a seeded table with a full scan instead of an index.
+
+    python check_query_plans.py [--rows 20000] [-v]
+
+The database lives in a temp directory; instance/solo_max.db is never touched.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+DB_DIR = tempfile.mkdtemp(prefix='solo-max-plans-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(DB_DIR, 'plans.db')
+
+from sqlalchemy import event, insert
+
+from app import (app, db, scheduler, AppliedJob, CoffeeChat, Contact, ContactedPerson, CoverLetter, Document, Job,
+                 OutboundEmail, User, check_follow_up_reminders, cover_letter_drafts, run_migrations,
+                 store_scraped_jobs, user_resume_text)
+
+SEEDED_TABLES = {'job', 'contact', 'contacted_person', 'applied_job', 'coffee_chat', 'cover_letter', 'document',
+                 'outbound_email'}
+
+# (label, table) pairs that read a whole table on purpose
+ALLOWED_SCANS = {
+    ('GET /api/people/ranked', 'contact'): 'ranking scores every stored contact in one columnar pass',
+    ('GET /api/people/ranked?company=bain', 'contact'): 'company filter is a substring match'
+}
+
+ROUTES = [
+    '/api/user/profile',
+    '/api/documents/resume',
+    '/api/people/contacted',
+    '/api/tasks/progress',
+    '/api/jobs/applied?sortBy=date',
+    '/api/jobs/applied?sortBy=company',
+    '/api/people/ranked',
+    '/api/people/ranked?company=bain',
+    '/api/emails/outbox',
+    '/api/metrics/outbox'
+]
+
+
+def seed(rows):
+    companies = ['McKinsey & Company', 'Bain & Company', 'Boston Consulting Group', 'Goldman Sachs', 'Google',
+                 'Deloitte', 'Acme Corp'] + [f'Company {i}' for i in range(200)]
+    now = datetime.utcnow()
+    users = max(10, rows // 400)
+
+    def ago(days):
+        return now - timedelta(days=random.random() * days)
+
+    tables = [
+        (User, [{'username': f'user{i}', 'email': f'user{i}@example.com', 'password_hash': '-'} for i in range(users)]),
+        (Job, [{'external_id': f'job_{i}', 'company': random.choice(companies), 'role': f'Analyst {i}',
+                'source': 'LinkedIn', 'url': f'https://example.com/jobs/{i}', 'scraped_at': ago(60),
+                'requires_cover_letter': i % 3 == 0} for i in range(rows)]),
+        (Contact, [{'name': f'Person {i} Smith', 'company': random.choice(companies), 'role': 'Consultant',
+                    'location': 'New York, NY', 'email': f'person{i}@example.com', 'predicted_email': i % 2 == 0,
+                    'scraped_at': ago(60)} for i in range(rows)]),
+        (ContactedPerson, [{'user_id': random.randint(1, users), 'contact_id': random.randint(1, rows),
+                            'contacted_at': ago(6), 'status': 'sent'} for _ in range(rows)]),
+        (AppliedJob, [{'user_id': 1 + i % users, 'job_id': 1 + i} for i in range(rows // 2)]),
+        (CoverLetter, [{'user_id': 1 + i % users, 'job_id': 1 + i, 'content': '-'} for i in range(rows // 2)]),
+        (Document, [{'user_id': 1 + i % users, 'doc_type': random.choice(['resume', 'coffee_chat_template']),
+                     'filename': f'doc{i}.txt', 'content': 'resume text', 'uploaded_at': ago(90)}
+                    for i in range(rows // 4)]),
+        (CoffeeChat, [{'user_id': random.randint(1, users), 'contact_id': random.randint(1, rows),
+                       'scheduled_at': ago(60), 'completed': random.random() < 0.5} for _ in range(rows // 2)]),
+        (OutboundEmail, [{'user_id': random.randint(1, users), 'kind': 'coffee_chat',
+                          'recipient_email': f'person{i}@example.com', 'subject': '-', 'body': '-',
+                          'status': random.choice(['sent', 'sent', 'queued', 'failed']), 'created_at': ago(30),
+                          'next_attempt_at': ago(30), 'sent_at': ago(1)} for i in range(rows // 2)])
+    ]
+    for model, records in tables:
+        db.session.execute(insert(model), records)
+    db.session.commit()
+    with db.engine.connect() as connection:
+        connection.exec_driver_sql('ANALYZE')
+
+
+class PlanRecorder:
+    """Collects statements issued on the main thread, tagged with the current label"""
+    def __init__(self):
+        self.label = None
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.label and not executemany and threading.current_thread() is threading.main_thread():
+            verb = statement.lstrip().split(None, 1)[0].upper()
+            if verb in ('SELECT', 'UPDATE', 'DELETE'):
+                self.statements.append((self.label, statement, parameters))
+
+    @contextmanager
+    def tagged(self, label):
+        self.label = label
+        try:
+            yield
+        finally:
+            self.label = None
+
+
+def offline_paths(user_id):
+    """Lookups the scrapers and scheduler jobs make, run directly since their callers need a browser or network"""
+    existing = [{'external_id': f'job_{i}', 'company': 'Acme Corp', 'role': 'Analyst', 'url': '-', 'source': 'LinkedIn'}
+                for i in range(0, 200, 4)]
+    fresh = [dict(job, external_id=f"new_{job['external_id']}") for job in existing]
+    return [
+        ('store_scraped_jobs', lambda: store_scraped_jobs(existing + fresh)),
+        ('check_follow_up_reminders', check_follow_up_reminders),
+        ('user_resume_text', lambda: user_resume_text(user_id)),
+        ('cover_letter_drafts.ready_draft', lambda: cover_letter_drafts.ready_draft(user_id, 1)),
+        # Same lookups as the inline route code
+        ('sync_outlook_calendar contact by email', lambda: Contact.query.filter_by(email='person42@example.com').first()),
+        ('search_people existing contact', lambda: Contact.query.filter_by(name='Person 42 Smith', company='Google').first()),
+        ('apply_to_jobs already applied', lambda: AppliedJob.query.filter_by(user_id=user_id, job_id=7).first()),
+        ('apply_to_jobs recent coffee chats', lambda: CoffeeChat.query.filter_by(user_id=user_id, completed=True).order_by(
+            CoffeeChat.scheduled_at.desc()).limit(5).all()),
+        ('create_coffee_chat existing chat', lambda: CoffeeChat.query.filter_by(user_id=user_id, contact_id=42).order_by(
+            CoffeeChat.scheduled_at.desc()).first()),
+        ('select_display_jobs top-up', lambda: Job.query.filter(Job.id.notin_([1, 2, 3])).order_by(
+            Job.scraped_at.desc()).limit(5).all())
+    ]
+
+
+def full_scans(connection, statement, parameters):
+    """Seeded tables the statement reads without an index, with the plan lines"""
+    plan = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+    details = [row[-1] for row in plan]
+    scanned = set()
+    for detail in details:
+        words = detail.split()
+        # "SCAN job" is a full table scan; "SCAN job USING INDEX ..." walks an index
+        if len(words) >= 2 and words[0] == 'SCAN' and 'USING' not in words:
+            table = words[1]
+            if table in SEEDED_TABLES:
+                scanned.add(table)
+    return scanned, details
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000, help='rows per large table')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print every plan')
+    args = parser.parse_args()
+
+    scheduler.pause()
+    random.seed(7)
+    recorder = PlanRecorder()
+
+    with app.app_context():
+        started = time.perf_counter()
+        run_migrations()
+        seed(args.rows)
+        print(f"seeded {args.rows} rows per table in {time.perf_counter() - started:.1f}s ({DB_DIR})")
+
+        event.listen(db.engine, 'before_cursor_execute', recorder)
+        user_id = 1
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+        for route in ROUTES:
+            with recorder.tagged(f'GET {route}'):
+                response = client.get(route)
+            if response.status_code >= 400:
+                print(f"  ! GET {route} answered {response.status_code}")
+
+        for label, run in offline_paths(user_id):
+            with recorder.tagged(label):
+                run()
+            db.session.rollback()
+
+        event.remove(db.engine, 'before_cursor_execute', recorder)
+
+        failures = []
+        seen = set()
+        with db.engine.connect() as connection:
+            for label, statement, parameters in recorder.statements:
+                if (label, statement) in seen:
+                    continue
+                seen.add((label, statement))
+                scanned, details = full_scans(connection, statement, parameters)
+                if args.verbose:
+                    print(f"{label}: {' '.join(statement.split())[:120]}")
+                    for detail in details:
+                        print(f"    {detail}")
+                for table in sorted(scanned):
+                    reason = ALLOWED_SCANS.get((label, table))
+                    if reason:
+                        print(f"  ~ {label}: full scan of {table} allowed ({reason})")
+                    else:
+                        failures.append((label, table, ' '.join(statement.split())))
+
+    print(f"checked {len(seen)} distinct queries from {len(ROUTES)} routes and {len(offline_paths(user_id))} offline lookups")
+    if failures:
+        print(f"{len(failures)} full table scan(s):")
+        for label, table, statement in failures:
+            print(f"  {label}: SCAN {table}\n    {statement[:200]}")
+        return 1
+    print("no unexpected full table scans")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Local stand-in for the slice of Microsoft Graph the backend uses.
+
+Serves /v1.0/me/sendMail, /v1.0/$batch and /v1.0/me/calendarview so the email
+flows can be exercised without a tenant. Start it and point the backend at it:
+
+    python graph_standin.py --port 5001 --throttle-every 7
+    GRAPH_API_BASE=http://127.0.0.1:5001/v1.0 python app.py
+
+Any bearer token is accepted. Sent messages are listed at GET /_sent and
+cleared with DELETE /_sent. With --throttle-every N, every Nth sendMail
+answers 429 with a Retry-After header, the way Graph throttles a mailbox.
+"""
+import argparse
+import itertools
+import threading
+
+from flask import Flask, jsonify, request
+
+app = Flask(__name__)
+
+sent = []
+sent_lock = threading.Lock()
+send_counter = itertools.count(1)
+settings = {'throttle_every': 0, 'retry_after': 1}
+
+
+def authorized(headers):
+    return (headers.get('Authorization') or '').startswith('Bearer ')
+
+
+def graph_error(status, code, message):
+    return {'error': {'code': code, 'message': message}}, status
+
+
+def send_mail(payload):
+    """Returns (body, status, headers) for one sendMail call"""
+    if settings['throttle_every'] and next(send_counter) % settings['throttle_every'] == 0:
+        body, status = graph_error(429, 'ApplicationThrottled', 'Application is over its MailboxConcurrency limit.')
+        return body, status, {'Retry-After': str(settings['retry_after'])}
+
+    message = (payload or {}).get('message') or {}
+    recipients = message.get('toRecipients') or []
+    if not recipients or not recipients[0].get('emailAddress', {}).get('address'):
+        body, status = graph_error(400, 'ErrorInvalidRecipients', 'At least one recipient is not valid.')
+        return body, status, {}
+
+    with sent_lock:
+        sent.append(message)
+    return None, 202, {}
+
+
+@app.route('/v1.0/me/sendMail', methods=['POST'])
+def me_send_mail():
+    if not authorized(request.headers):
+        return jsonify(graph_error(401, 'InvalidAuthenticationToken', 'Access token is empty.')[0]), 401
+    body, status, headers = send_mail(request.get_json(silent=True))
+    return (jsonify(body) if body else ''), status, headers
+
+
+@app.route('/v1.0/$batch', methods=['POST'])
+def batch():
+    if not authorized(request.headers):
+        return jsonify(graph_error(401, 'InvalidAuthenticationToken', 'Access token is empty.')[0]), 401
+
+    sub_requests = (request.get_json(silent=True) or {}).get('requests') or []
+    if len(sub_requests) > 20:
+        return jsonify(graph_error(400, 'BadRequest', 'Maximum number of requests in a batch is 20.')[0]), 400
+
+    responses = []
+    for sub in sub_requests:
+        if sub.get('method') == 'POST' and sub.get('url') == '/me/sendMail':
+            body, status, headers = send_mail(sub.get('body'))
+        else:
+            (body, status), headers = graph_error(404, 'NotFound', f"{sub.get('method')} {sub.get('url')} is not emulated"), {}
+        response = {'id': sub.get('id'), 'status': status, 'headers': headers}
+        if body:
+            response['body'] = body
+        responses.append(response)
+    return jsonify({'responses': responses})
+
+
+@app.route('/v1.0/me/calendarview', methods=['GET'])
+def calendar_view():
+    if not authorized(request.headers):
+        return jsonify(graph_error(401, 'InvalidAuthenticationToken', 'Access token is empty.')[0]), 401
+    return jsonify({'value': []})
+
+
+@app.route('/_sent', methods=['GET', 'DELETE'])
+def sent_messages():
+    with sent_lock:
+        if request.method == 'DELETE':
+            sent.clear()
+        return jsonify({'count': len(sent), 'messages': list(sent)})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--throttle-every', type=int, default=0, help='answer every Nth sendMail with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='seconds sent in Retry-After when throttling')
+    args = parser.parse_args()
+    settings['throttle_every'] = args.throttle_every
+    settings['retry_after'] = args.retry_after
+    app.run(host='127.0.0.1', port=args.port, debug=False, threaded=True)
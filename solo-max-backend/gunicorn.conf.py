@@ -0,0 +1,13 @@
+"""Gunicorn settings, picked up automatically by `gunicorn app:app` run from this directory.
+
+Workers are threaded (gthread): a Server-Sent Events stream (job search tasks, streamed
+drafts) holds one thread while it is open instead of a whole sync worker process.
+Background search tasks are stored in the database, so polls and streams can land on
+any worker.
+"""
+import os
+
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+# Keep threads within DB_POOL_SIZE + DB_MAX_OVERFLOW, which also serve the scheduler and worker pools
+threads = int(os.environ.get('GUNICORN_THREADS', 8))